@@ -9,13 +9,22 @@ Usage:
     nox -s docs_linkcheck  # Check external links
     nox -s docs_spelling   # Check spelling
     nox -s docs_clean    # Clean build artifacts
+    nox -s docs_clean -- --all  # Also clear the download and results caches
+
+Virtualenvs are reused between runs. Add ``--no-install`` (or use
+``nox -R``) to also skip the dependency install step entirely.
 """
 
+import os
+
 import nox
 
 # Default sessions to run when just typing 'nox'
 nox.options.sessions = ["docs"]
 
+# Reuse session virtualenvs instead of recreating them on every run
+nox.options.reuse_existing_virtualenvs = True
+
 # Python version for documentation builds
 PYTHON_VERSION = "3.12"
 
@@ -23,6 +32,68 @@ PYTHON_VERSION = "3.12"
 DOCS_DIR = "docs"
 BUILD_DIR = f"{DOCS_DIR}/_build"
 
+# Package sources, whose docstrings feed the API pages. For a flat
+# layout, set this to the package directory (e.g. "mypackage").
+SRC_DIR = "src"
+
+# Cache directory kept outside BUILD_DIR so it survives between runs
+CACHE_DIR = ".docs-cache"
+
+# conf.py keeps its own caches (intersphinx inventories, executed
+# notebooks, link check results) in the same directory
+os.environ["DOCS_CACHE_DIR"] = os.path.abspath(CACHE_DIR)
+
+# Doctree directory shared by every Sphinx builder so the parsed
+# environment (environment.pickle) is reused instead of re-read
+DOCTREE_DIR = f"{CACHE_DIR}/doctrees"
+
+# Full builds load extra extensions (see DOCS_FULL in conf.py), which
+# changes the environment; keep it apart so it does not invalidate the
+# one used by the other sessions
+FULL_DOCTREE_DIR = f"{CACHE_DIR}/doctrees-full"
+
+# Parallel reading/writing for sphinx-build (-j). Sphinx falls back to a
+# serial build with a warning (an error under -W) if an extension is not
+# parallel safe. Use a fixed number such as "4" on shared CI runners.
+# docs_all splits these between the builders it runs concurrently.
+SPHINX_JOBS = "auto"
+
+# Re-check external links in docs_all at least this often
+LINKCHECK_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+
+def _install_docs(session, *extra):
+    """Install the package in editable mode with its docs dependencies.
+
+    Editable installs pick up source changes without reinstalling, so a
+    reused virtualenv stays current.
+    """
+    session.install("-e", ".[docs]", *extra)
+
+
+def _tree_hash(*roots):
+    """Hash the paths and mtimes of all files under the given directories.
+
+    Only ``stat`` results are read, so this is cheap enough to run on
+    every build. Build output and hidden directories are skipped.
+    """
+    import hashlib
+
+    digest = hashlib.blake2b()
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(
+                d for d in dirnames if d != "_build" and not d.startswith(".")
+            )
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:  # e.g. a dangling symlink
+                    continue
+                digest.update(f"{path}\0{mtime_ns}\0".encode())
+    return digest.hexdigest()
+
 
 @nox.session(python=PYTHON_VERSION)
 def docs(session):
@@ -33,13 +104,15 @@ def docs(session):
     2. Runs sphinx-build to generate HTML documentation
     3. Treats warnings as errors (fail fast)
     """
-    session.install(".[docs]")
+    _install_docs(session)
 
     session.run(
         "sphinx-build",
         "-W",  # Treat warnings as errors
         "--keep-going",  # Continue on errors to see all issues
         "-b", "html",  # Build HTML
+        "-d", DOCTREE_DIR,  # Reuse the parsed environment across builders
+        "-j", SPHINX_JOBS,  # Read and write in parallel
         DOCS_DIR,
         f"{BUILD_DIR}/html",
         *session.posargs,  # Allow passing extra args
@@ -61,7 +134,7 @@ def docs_live(session):
     3. Automatically rebuilds on file changes
     4. Opens browser automatically
     """
-    session.install(".[docs]", "sphinx-autobuild")
+    _install_docs(session, "sphinx-autobuild")
 
     session.run(
         "sphinx-autobuild",
@@ -86,14 +159,19 @@ def docs_linkcheck(session):
     1. Installs package with docs dependencies
     2. Runs linkcheck builder
     3. Reports broken external links
+
+    Links found working in the last week are skipped; the results cache
+    lives in the cache directory and is maintained by ``conf.py``.
     """
-    session.install(".[docs]")
+    _install_docs(session)
 
     session.run(
         "sphinx-build",
         "-W",
         "--keep-going",
         "-b", "linkcheck",
+        "-d", DOCTREE_DIR,
+        "-j", SPHINX_JOBS,
         DOCS_DIR,
         f"{BUILD_DIR}/linkcheck",
         *session.posargs,
@@ -122,13 +200,15 @@ def docs_spelling(session):
         # Windows
         # Install from https://github.com/AbiWord/enchant
     """
-    session.install(".[docs]", "sphinxcontrib-spelling")
+    _install_docs(session, "sphinxcontrib-spelling")
 
     session.run(
         "sphinx-build",
         "-W",
         "--keep-going",
         "-b", "spelling",
+        "-d", DOCTREE_DIR,
+        "-j", SPHINX_JOBS,
         DOCS_DIR,
         f"{BUILD_DIR}/spelling",
         *session.posargs,
@@ -146,11 +226,13 @@ def docs_coverage(session):
     1. Builds documentation with coverage builder
     2. Reports undocumented objects
     """
-    session.install(".[docs]")
+    _install_docs(session)
 
     session.run(
         "sphinx-build",
         "-b", "coverage",
+        "-d", DOCTREE_DIR,
+        "-j", SPHINX_JOBS,
         DOCS_DIR,
         f"{BUILD_DIR}/coverage",
         *session.posargs,
@@ -168,12 +250,14 @@ def docs_doctest(session):
     1. Executes code examples in docstrings
     2. Verifies outputs match expected results
     """
-    session.install(".[docs]")
+    _install_docs(session)
 
     session.run(
         "sphinx-build",
         "-W",
         "-b", "doctest",
+        "-d", DOCTREE_DIR,
+        "-j", SPHINX_JOBS,
         DOCS_DIR,
         f"{BUILD_DIR}/doctest",
         *session.posargs,
@@ -199,13 +283,15 @@ def docs_pdf(session):
         # Windows
         # Install MiKTeX from https://miktex.org/
     """
-    session.install(".[docs]")
+    _install_docs(session)
 
     # Build LaTeX
     session.run(
         "sphinx-build",
         "-W",
         "-b", "latex",
+        "-d", DOCTREE_DIR,
+        "-j", SPHINX_JOBS,
         DOCS_DIR,
         f"{BUILD_DIR}/latex",
         *session.posargs,
@@ -224,17 +310,26 @@ def docs_clean(session):
     """Clean documentation build artifacts.
 
     This session:
-    1. Removes _build directory
+    1. Removes _build directory and cached doctrees
     2. Removes auto-generated files
+
+    The rest of the cache directory is kept: intersphinx inventories,
+    executed notebooks and link check results. Pass ``--all``
+    (``nox -s docs_clean -- --all``) to remove the whole cache directory,
+    e.g. when notebooks or their outputs have piled up.
     """
     import shutil
     from pathlib import Path
 
-    # Remove build directory
-    build_path = Path(BUILD_DIR)
-    if build_path.exists():
-        shutil.rmtree(build_path)
-        session.log(f"Removed {BUILD_DIR}")
+    # Remove build and doctree directories, or the whole cache with --all
+    if "--all" in session.posargs:
+        paths = (Path(BUILD_DIR), Path(CACHE_DIR))
+    else:
+        paths = (Path(BUILD_DIR), Path(DOCTREE_DIR), Path(FULL_DOCTREE_DIR))
+    for path in paths:
+        if path.exists():
+            shutil.rmtree(path)
+            session.log(f"Removed {path}")
 
     # Remove autosummary generated files
     generated_path = Path(DOCS_DIR) / "generated"
@@ -245,10 +340,14 @@ def docs_clean(session):
     # Remove auto-generated API docs
     api_path = Path(DOCS_DIR) / "api"
     if api_path.exists():
-        for f in api_path.glob("*.rst"):
-            if f.name != "index.rst":  # Keep index
-                f.unlink()
-                session.log(f"Removed {f}")
+        # scandir yields entries with their names already read, so no
+        # Path object or extra stat is needed per file
+        with os.scandir(api_path) as entries:
+            for entry in entries:
+                # Keep index
+                if entry.name.endswith(".rst") and entry.name != "index.rst":
+                    os.unlink(entry.path)
+                    session.log(f"Removed {entry.path}")
 
     session.log("Documentation cleaned successfully!")
 
@@ -259,50 +358,117 @@ def docs_all(session):
 
     This session:
     1. Builds HTML documentation
-    2. Checks links
-    3. Runs doctests
-    4. Checks coverage
+    2. Checks links, runs doctests and checks coverage concurrently
+
+    The HTML build parses the sources into the full-build doctree directory.
+    Sphinx may still update the pickled environment from any builder, so
+    each of the remaining builders gets its own copy of it and they can
+    run side by side. Only the HTML build uses all ``SPHINX_JOBS``; the
+    concurrent builders split them.
+
+    Link check and coverage are skipped when nothing under ``DOCS_DIR``
+    or ``SRC_DIR`` changed since they last passed; link check still runs
+    at least once a week. Run ``nox -s docs_clean`` to force every
+    builder. If ``SRC_DIR`` does not exist (e.g. a flat layout where it
+    was not updated), API changes cannot be detected and nothing is
+    skipped.
+
+    This is a full build: ``DOCS_FULL`` enables the extensions left out
+    of quick builds, such as source code links (viewcode).
     """
-    session.install(".[docs]")
-
-    # HTML
-    session.log("Building HTML documentation...")
-    session.run(
-        "sphinx-build",
-        "-W", "--keep-going",
-        "-b", "html",
-        DOCS_DIR,
-        f"{BUILD_DIR}/html",
-    )
-
-    # Link check
-    session.log("Checking links...")
-    session.run(
-        "sphinx-build",
-        "-W", "--keep-going",
-        "-b", "linkcheck",
-        DOCS_DIR,
-        f"{BUILD_DIR}/linkcheck",
-    )
-
-    # Doctest
-    session.log("Running doctests...")
-    session.run(
-        "sphinx-build",
-        "-W",
-        "-b", "doctest",
-        DOCS_DIR,
-        f"{BUILD_DIR}/doctest",
-    )
+    import json
+    import shutil
+    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from pathlib import Path
 
-    # Coverage
-    session.log("Checking coverage...")
-    session.run(
-        "sphinx-build",
-        "-b", "coverage",
-        DOCS_DIR,
-        f"{BUILD_DIR}/coverage",
-    )
+    _install_docs(session)
+
+    session.env["DOCS_FULL"] = "1"
+
+    def build(builder, *flags, doctree_dir=FULL_DOCTREE_DIR, jobs=SPHINX_JOBS):
+        session.log(f"Running {builder} builder...")
+        session.run(
+            "sphinx-build",
+            *flags,
+            "-b", builder,
+            "-d", doctree_dir,
+            "-j", jobs,
+            DOCS_DIR,
+            f"{BUILD_DIR}/{builder}",
+        )
+        return builder
+
+    # HTML (populates the shared environment)
+    build("html", "-W", "--keep-going")
+
+    # Hash after the HTML build so autosummary stubs it generates count
+    # as part of the sources
+    state_path = Path(BUILD_DIR) / ".docs-all-cache.json"
+    try:
+        state = json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        state = {}
+    if os.path.isdir(SRC_DIR):
+        source_hash = _tree_hash(DOCS_DIR, SRC_DIR)
+    else:
+        session.warn(
+            f"{SRC_DIR} not found, running every builder; "
+            "set SRC_DIR to the package sources to skip unchanged ones"
+        )
+        source_hash = None
+    now = time.time()
+
+    def is_current(builder, max_age=None):
+        entry = state.get(builder)
+        return (
+            source_hash is not None
+            and entry is not None
+            and entry["hash"] == source_hash
+            and (max_age is None or now - entry["time"] < max_age)
+        )
+
+    # Link check, doctest and coverage
+    builders = [("doctest", "-W")]
+
+    if is_current("linkcheck", LINKCHECK_MAX_AGE):
+        session.log("Skipping linkcheck (sources unchanged)")
+    else:
+        builders.append(("linkcheck", "-W", "--keep-going"))
+
+    if is_current("coverage"):
+        session.log("Skipping coverage (sources unchanged)")
+    else:
+        builders.append(("coverage",))
+
+    # Share the available processes instead of giving each builder all
+    if SPHINX_JOBS == "auto":
+        total_jobs = os.cpu_count() or 1
+    else:
+        total_jobs = int(SPHINX_JOBS)
+    jobs = str(max(1, total_jobs // len(builders)))
+
+    with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+        futures = []
+        for builder, *flags in builders:
+            # Private copy of the HTML build's environment
+            doctree_dir = f"{BUILD_DIR}/.doctrees-{builder}"
+            shutil.rmtree(doctree_dir, ignore_errors=True)
+            shutil.copytree(FULL_DOCTREE_DIR, doctree_dir)
+            futures.append(
+                executor.submit(
+                    build, builder, *flags, doctree_dir=doctree_dir, jobs=jobs
+                )
+            )
+
+        for future in as_completed(futures):
+            # Re-raises the first failing builder's error
+            builder = future.result()
+            session.log(f"Finished {builder} builder")
+
+            # Remember passing runs so unchanged sources can skip them
+            state[builder] = {"hash": source_hash, "time": now}
+            state_path.write_text(json.dumps(state, indent=1))
 
     session.log("All documentation builds complete!")
 
@@ -315,7 +481,7 @@ def docs_mkdocs(session):
 
     Alternative to Sphinx for projects using MkDocs.
     """
-    session.install(".[docs]")
+    _install_docs(session)
 
     session.run(
         "mkdocs",
@@ -331,7 +497,7 @@ def docs_mkdocs(session):
 @nox.session(python=PYTHON_VERSION)
 def docs_mkdocs_serve(session):
     """Serve MkDocs documentation with live reload."""
-    session.install(".[docs]")
+    _install_docs(session)
 
     session.run(
         "mkdocs",
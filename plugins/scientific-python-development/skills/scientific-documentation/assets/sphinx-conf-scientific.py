@@ -4,6 +4,7 @@
 # This file contains the configuration for building documentation using Sphinx
 # with extensions optimized for scientific Python packages.
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -32,16 +33,17 @@ extensions = [
     # Core Sphinx extensions
     "sphinx.ext.autodoc",        # Auto-generate docs from docstrings
     "sphinx.ext.autosummary",    # Generate summary tables
-    "sphinx.ext.viewcode",       # Add source code links
     "sphinx.ext.intersphinx",    # Link to other projects' documentation
     "sphinx.ext.todo",           # Support for todo items
     "sphinx.ext.coverage",       # Check documentation coverage
     "sphinx.ext.doctest",        # Test code examples
 
     # Scientific Python extensions
+    # napoleon parses NumPy-style docstrings, so numpydoc is not loaded as
+    # well; both would process every docstring. Use `numpydoc lint` (e.g.
+    # as a pre-commit hook) to validate docstrings outside the build.
     "sphinx.ext.napoleon",       # NumPy/Google docstrings support
     "sphinx.ext.mathjax",        # Math rendering
-    "numpydoc",                  # NumPy documentation style
     "sphinx_autodoc_typehints",  # Type hint integration
 
     # Markdown support
@@ -51,6 +53,12 @@ extensions = [
     "nbsphinx",                  # Jupyter notebook rendering
 ]
 
+# Source code links. viewcode highlights every module into its own page,
+# which dominates the writing phase on large packages, so it is only
+# enabled for full builds (``DOCS_FULL=1``, set by ``nox -s docs_all``).
+if os.environ.get("DOCS_FULL"):
+    extensions.append("sphinx.ext.viewcode")
+
 # Add any paths that contain templates here, relative to this directory
 templates_path = ["_templates"]
 
@@ -104,6 +112,10 @@ autodoc_default_options = {
     "show-inheritance": True,
 }
 
+# Render type hints once, in the parameter descriptions, not also in
+# the signature
+autodoc_typehints = "description"
+
 # -- Napoleon Configuration --------------------------------------------------
 
 # Configure support for NumPy-style docstrings
@@ -122,20 +134,47 @@ napoleon_use_keyword = True
 napoleon_type_aliases = None
 napoleon_attr_annotations = True
 
+# -- Cache directory ---------------------------------------------------------
+
+# Downloads and results reused between builds, kept outside _build so
+# they survive cleans and fresh nox environments. The noxfile sets
+# DOCS_CACHE_DIR; otherwise .docs-cache next to the docs directory is used.
+_docs_cache = Path(
+    os.environ.get("DOCS_CACHE_DIR")
+    or Path(__file__).resolve().parent.parent / ".docs-cache"
+)
+
 # -- Intersphinx Configuration -----------------------------------------------
 
-# Mapping to external documentation
+# Local copies of the inventories, refreshed in setup() below
+_intersphinx_cache = _docs_cache / "intersphinx"
+
+# Revalidate cached inventories with the server once they are this old
+_intersphinx_max_age = 24 * 60 * 60  # seconds
+
+# Timeout for revalidating a cached inventory (in seconds). Kept short
+# since the stale copy is still usable if the server is slow or offline.
+_intersphinx_revalidate_timeout = 5
+
+# External documentation to link to
+_intersphinx_urls = {
+    "python": "https://docs.python.org/3",
+    "numpy": "https://numpy.org/doc/stable/",
+    "scipy": "https://docs.scipy.org/doc/scipy/",
+    "pandas": "https://pandas.pydata.org/docs/",
+    "matplotlib": "https://matplotlib.org/stable/",
+    "xarray": "https://docs.xarray.dev/en/stable/",
+    "sklearn": "https://scikit-learn.org/stable/",
+    "dask": "https://docs.dask.org/en/stable/",
+    "numba": "https://numba.readthedocs.io/en/stable/",
+    "zarr": "https://zarr.readthedocs.io/en/stable/",
+}
+
+# Mapping to external documentation. Sphinx tries the cached inventory
+# first and falls back to downloading it (None) when the file is missing.
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3", None),
-    "numpy": ("https://numpy.org/doc/stable/", None),
-    "scipy": ("https://docs.scipy.org/doc/scipy/", None),
-    "pandas": ("https://pandas.pydata.org/docs/", None),
-    "matplotlib": ("https://matplotlib.org/stable/", None),
-    "xarray": ("https://docs.xarray.dev/en/stable/", None),
-    "sklearn": ("https://scikit-learn.org/stable/", None),
-    "dask": ("https://docs.dask.org/en/stable/", None),
-    "numba": ("https://numba.readthedocs.io/en/stable/", None),
-    "zarr": ("https://zarr.readthedocs.io/en/stable/", None),
+    name: (url, (str(_intersphinx_cache / f"{name}.inv"), None))
+    for name, url in _intersphinx_urls.items()
 }
 
 # Timeout for retrieving intersphinx inventories (in seconds)
@@ -155,6 +194,23 @@ nbsphinx_timeout = 60
 # Custom formats for notebook input/output prompts
 nbsphinx_prompt_width = "0"
 
+# Outputs of executed notebooks, keyed by a hash of their code cells,
+# reused across CI runs and cleans (see setup())
+_notebook_cache = _docs_cache / "notebooks"
+
+# -- Linkcheck Configuration -------------------------------------------------
+
+# Check links concurrently and give up on slow hosts quickly
+linkcheck_workers = 16
+linkcheck_timeout = 10
+
+# Links found working by earlier runs, with the time they were checked
+# (see setup())
+_linkcheck_cache = _docs_cache / "linkcheck.json"
+
+# Working links are not checked again until they are this old
+_linkcheck_max_age = 7 * 24 * 60 * 60  # seconds
+
 # -- Options for HTML output -------------------------------------------------
 
 # The theme to use for HTML and HTML Help pages
@@ -262,15 +318,204 @@ todo_include_todos = True
 coverage_write_headline = False
 coverage_show_missing_items = True
 
+# sphinx.ext.viewcode (full builds only)
+viewcode_enable_epub = False
+viewcode_follow_imported_members = False
+
 # sphinx_autodoc_typehints
 typehints_fully_qualified = False
+typehints_use_signature = False
+typehints_use_signature_return = False
 always_document_param_types = True
 typehints_document_rtype = True
 
 # -- Custom Configuration ----------------------------------------------------
 
+def _refresh_intersphinx_cache(logger):
+    """Refresh the cached intersphinx inventories.
+
+    Inventories younger than ``_intersphinx_max_age`` are used as is.
+    Older ones are revalidated with an ``If-Modified-Since`` request, so
+    an unchanged inventory costs a 304 response instead of a download.
+    All requests run concurrently. On network errors the stale copy (or
+    the remote fallback) is used.
+    """
+    import time
+    import urllib.error
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+    from email.utils import formatdate
+
+    _intersphinx_cache.mkdir(parents=True, exist_ok=True)
+
+    def refresh(name, url):
+        """Refresh one inventory, returning an error message on failure."""
+        path = _intersphinx_cache / f"{name}.inv"
+        headers = {}
+        timeout = intersphinx_timeout
+        if path.exists():
+            mtime = path.stat().st_mtime
+            if time.time() - mtime < _intersphinx_max_age:
+                return None
+            headers["If-Modified-Since"] = formatdate(mtime, usegmt=True)
+            timeout = _intersphinx_revalidate_timeout
+
+        inv_url = f"{url.rstrip('/')}/objects.inv"
+        request = urllib.request.Request(inv_url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                path.write_bytes(response.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                path.touch()  # Not modified, restart the max-age clock
+            else:
+                return f"intersphinx: could not refresh {inv_url}: {e}"
+        except OSError as e:
+            return f"intersphinx: could not refresh {inv_url}: {e}"
+        return None
+
+    workers = len(_intersphinx_urls) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        names = list(_intersphinx_urls)
+        urls = [_intersphinx_urls[name] for name in names]
+        for error in executor.map(refresh, names, urls):
+            if error is not None:
+                logger.info(error)
+
+
+def _use_cached_notebook(app, docname, source):
+    """Serve notebooks without outputs from the executed-notebook cache.
+
+    With ``nbsphinx_execute = "auto"`` nbsphinx only runs notebooks that
+    have no stored outputs. Such notebooks are executed here instead and
+    the outputs of their code cells are cached under a SHA-256 of the
+    kernel name, the notebook's directory and the code. Later builds
+    merge the cached outputs into the current notebook, so markdown
+    edits show up and nothing is run again until the code changes.
+    """
+    import hashlib
+    import json
+
+    import nbformat
+
+    if app.config.nbsphinx_execute != "auto":
+        return
+    if not str(app.env.doc2path(docname)).endswith(".ipynb"):
+        return
+
+    nb = nbformat.reads(source[0], as_version=4)
+    if nb.metadata.get("nbsphinx", {}).get("execute") == "never":
+        return
+    code_cells = [cell for cell in nb.cells if cell.cell_type == "code"]
+    if not code_cells:
+        return  # Nothing to execute
+    if any(cell.get("outputs") for cell in code_cells):
+        return  # Stored outputs are used as is
+
+    notebook_dir = Path(app.env.doc2path(docname)).parent
+    kernel_name = app.config.nbsphinx_kernel_name or nb.metadata.get(
+        "kernelspec", {}
+    ).get("name", "")
+    digest = hashlib.sha256()
+    for part in (kernel_name, str(notebook_dir.resolve())):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for cell in code_cells:
+        digest.update(cell.source.encode())
+        digest.update(b"\0")
+    cached = _notebook_cache / f"{digest.hexdigest()}.json"
+
+    try:
+        results = json.loads(cached.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        from nbclient import NotebookClient
+
+        client = NotebookClient(
+            nb,
+            timeout=app.config.nbsphinx_timeout,
+            allow_errors=app.config.nbsphinx_allow_errors,
+            kernel_name=app.config.nbsphinx_kernel_name,
+            extra_arguments=app.config.nbsphinx_execute_arguments,
+            resources={"metadata": {"path": str(notebook_dir)}},
+        )
+        try:
+            client.execute()
+        except Exception:
+            # Let nbsphinx execute it again and report the error
+            return
+        results = [
+            {"outputs": cell.outputs, "execution_count": cell.execution_count}
+            for cell in code_cells
+        ]
+        _notebook_cache.mkdir(parents=True, exist_ok=True)
+        cached.write_text(json.dumps(results), encoding="utf-8")
+
+    # Only outputs come from the cache; everything else is the current text
+    for cell, result in zip(code_cells, results):
+        cell.outputs = [nbformat.from_dict(output) for output in result["outputs"]]
+        cell.execution_count = result["execution_count"]
+    source[0] = nbformat.writes(nb)
+
+
+def _load_linkcheck_cache():
+    """Return the mapping of working URLs to the time they were checked."""
+    import json
+
+    try:
+        return json.loads(_linkcheck_cache.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _skip_recently_checked_links(app, config):
+    """Ignore links that were found working within ``_linkcheck_max_age``.
+
+    Sphinx's linkcheck builder has no persistent cache of its own, so
+    recently verified URLs are added to ``linkcheck_ignore`` instead.
+    Broken links are never cached and are always checked again.
+    """
+    import re
+    import time
+
+    now = time.time()
+    fresh = [
+        f"^{re.escape(uri)}$"
+        for uri, checked in _load_linkcheck_cache().items()
+        if now - checked < _linkcheck_max_age
+    ]
+    config.linkcheck_ignore = [*config.linkcheck_ignore, *fresh]
+
+
+def _update_linkcheck_cache(app, exception):
+    """Record the results of a linkcheck run in ``_linkcheck_cache``."""
+    import json
+    import time
+
+    if exception is not None or app.builder.name != "linkcheck":
+        return
+
+    cache = _load_linkcheck_cache()
+    now = time.time()
+    with open(Path(app.outdir) / "output.json") as f:
+        for line in f:
+            result = json.loads(line)
+            if result["status"] in ("working", "redirected"):
+                cache[result["uri"]] = now
+            elif result["status"] != "ignored":
+                cache.pop(result["uri"], None)
+
+    _linkcheck_cache.parent.mkdir(parents=True, exist_ok=True)
+    _linkcheck_cache.write_text(json.dumps(cache, indent=1, sort_keys=True))
+
+
 # If you need to add custom CSS
 def setup(app):
     """Custom setup function."""
+    from sphinx.util import logging
+
+    _refresh_intersphinx_cache(logging.getLogger(__name__))
+    app.connect("source-read", _use_cached_notebook)
+    app.connect("config-inited", _skip_recently_checked_links)
+    app.connect("build-finished", _update_linkcheck_cache)
+
     # app.add_css_file("custom.css")
-    pass
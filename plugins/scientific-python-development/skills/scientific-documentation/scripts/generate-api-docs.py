@@ -6,27 +6,448 @@ This script automatically generates reStructuredText files for API
 documentation using Sphinx's autosummary. It creates a structured
 API reference with one file per module.
 
+Public members are read from each module's source with `ast`, so the
+package is not imported. Only modules without Python source (e.g.,
+extension modules) are imported and inspected.
+
 Usage:
     python scripts/generate-api-docs.py
     python scripts/generate-api-docs.py --package mypackage --output docs/reference
+    python scripts/generate-api-docs.py --package mypackage --jobs 4
 """
 
 import argparse
+import ast
 import importlib
-import inspect
+import importlib.util
+import json
+import os
+import pkgutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Cache of public members per module, stored in the output directory
+CACHE_FILENAME = ".api-docs-cache.json"
+# Bumped whenever member discovery changes, so older entries are redone
+CACHE_VERSION = 3
+
+# Section headers (heading, underline and autosummary directive), built
+# once and shared by every generated page
+FUNCTIONS_HEADER = (
+    "Functions\n"
+    + "-" * len("Functions")
+    + "\n\n"
+    + ".. autosummary::\n"
+    + "   :toctree: generated/\n\n"
+)
+CLASSES_HEADER = (
+    "Classes\n"
+    + "-" * len("Classes")
+    + "\n\n"
+    + ".. autosummary::\n"
+    + "   :toctree: generated/\n"
+    + "   :template: class.rst\n\n"
+)
+SUBMODULES_HEADER = (
+    "Submodules\n"
+    + "-" * len("Submodules")
+    + "\n\n"
+    + ".. autosummary::\n"
+    + "   :toctree: generated/\n"
+    + "   :recursive:\n\n"
+)
+
+
+def load_cache(path: Path) -> Dict[str, dict]:
+    """
+    Load the public members cache written by a previous run.
+
+    Parameters
+    ----------
+    path : Path
+        Cache file location.
+
+    Returns
+    -------
+    dict
+        Mapping of module name to cache entry. Empty if the file is
+        missing or unreadable.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path: Path, cache: Dict[str, dict]) -> None:
+    """
+    Write the public members cache.
+
+    Parameters
+    ----------
+    path : Path
+        Cache file location.
+    cache : dict
+        Mapping of module name to cache entry.
+    """
+    with open(path, "w") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    """Return the mtime and size of a file or directory, or None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _cache_get(
+    cache: Optional[Dict[str, dict]], module_name: str
+) -> Optional[Tuple[List[str], List[str], List[str]]]:
+    """Return cached members of a module if none of its dependencies changed."""
+    if cache is None or module_name not in cache:
+        return None
+    entry = cache[module_name]
+    if entry.get("version") != CACHE_VERSION:
+        return None
+    for path, key in entry["depends"].items():
+        if _stat_key(Path(path)) != key:
+            return None
+    return entry["functions"], entry["classes"], entry["submodules"]
+
+
+def _cache_put(
+    cache: Optional[Dict[str, dict]],
+    module_name: str,
+    depends: Iterable[Path],
+    members: Tuple[List[str], List[str], List[str]],
+) -> None:
+    """
+    Store the members of a module with the state of every path they depend on.
+
+    Directories may be listed too; their mtime changes when files are
+    added to or removed from them.
+    """
+    if cache is None:
+        return
+    functions, classes, submodules = members
+    cache[module_name] = {
+        "version": CACHE_VERSION,
+        "depends": {str(path): _stat_key(path) for path in depends},
+        "functions": functions,
+        "classes": classes,
+        "submodules": submodules,
+    }
+
+
+def _module_source(module_name: str, root: Path) -> Optional[Path]:
+    """Return the source file of a module below root, if it has one."""
+    base = root.joinpath(*module_name.split("."))
+    for candidate in (base / "__init__.py", base.with_suffix(".py")):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _source_root(module_name: str, path: Path) -> Path:
+    """Return the directory that contains a module's top-level package."""
+    depth = module_name.count(".")
+    if path.name == "__init__.py":
+        depth += 1
+    return path.parents[depth]
+
+
+# ``try`` blocks, including ``except*`` on Python 3.11+
+_TRY_NODES = tuple(
+    getattr(ast, name) for name in ("Try", "TryStar") if hasattr(ast, name)
+)
+
+
+def _module_statements(body: List[ast.stmt]) -> Iterable[ast.stmt]:
+    """
+    Yield the statements of a module body in order.
+
+    The branches of ``if`` and ``try`` blocks are included, since they
+    commonly bind public names (e.g. optional accelerated imports).
+    """
+    for node in body:
+        if isinstance(node, ast.If):
+            yield from _module_statements(node.body)
+            yield from _module_statements(node.orelse)
+        elif isinstance(node, _TRY_NODES):
+            yield from _module_statements(node.body)
+            for handler in node.handlers:
+                yield from _module_statements(handler.body)
+            yield from _module_statements(node.orelse)
+            yield from _module_statements(node.finalbody)
+        else:
+            yield node
+
+
+# Parsed modules, shared by every module handled in this process
+_parsed_modules: Dict[
+    Path, Tuple[Dict[str, Tuple[str, str]], Optional[List[str]], Set[Path]]
+] = {}
+
+
+def _parse_module(
+    module_name: str, path: Path, root: Path, _parsing: frozenset = frozenset()
+) -> Tuple[Dict[str, Tuple[str, str]], Optional[List[str]], Set[Path]]:
+    """
+    Statically collect the names bound at the top level of a module.
+
+    Functions and classes defined in the module, including inside ``if``
+    and ``try`` blocks, are taken directly from the syntax tree, along
+    with plain aliases of them (``name = other``). Names imported from
+    elsewhere in the same top-level package are resolved by parsing the
+    module they come from, including ``import *`` and the submodules
+    that imports bind in a package (``import pkg.sub`` or
+    ``from .sub import name`` in ``pkg/__init__.py``). Anything else,
+    such as third-party imports, is left out.
+
+    Parameters
+    ----------
+    module_name : str
+        Full module name.
+    path : Path
+        Source file of the module.
+    root : Path
+        Directory containing the top-level package.
+
+    Returns
+    -------
+    names : dict
+        Mapping of name to ``(kind, origin)``, where kind is "function",
+        "class" or "module" and origin is the module defining it.
+    all_names : list of str or None
+        Contents of ``__all__`` if it is a literal list or tuple of
+        strings, otherwise None.
+    depends : set of Path
+        Files and directories the result was derived from, including
+        those where an imported module would be looked up.
+    """
+    if path in _parsed_modules:
+        return _parsed_modules[path]
+    if path in _parsing:  # Import cycle
+        return {}, None, {path}
+    _parsing = _parsing | {path}
+
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    top_level = module_name.partition(".")[0]
+    if path.name == "__init__.py":
+        package_parts = module_name.split(".")
+    else:
+        package_parts = module_name.split(".")[:-1]
+
+    names = {}
+    all_names = None
+    depends = {path, path.parent}
+
+    for node in _module_statements(tree.body):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            names[node.name] = ("function", module_name)
+
+        elif isinstance(node, ast.ClassDef):
+            names[node.name] = ("class", module_name)
+
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            if isinstance(node, ast.Assign):
+                targets = node.targets
+            else:
+                targets = [node.target]
+            if (
+                isinstance(node, ast.Assign)
+                and isinstance(node.value, ast.Name)
+                and node.value.id in names
+            ):
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        names[target.id] = names[node.value.id]
+                continue
+            if node.value is None or not any(
+                isinstance(t, ast.Name) and t.id == "__all__" for t in targets
+            ):
+                continue
+            try:
+                value = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError):
+                value = None
+            if not isinstance(value, (list, tuple)) or not all(
+                isinstance(name, str) for name in value
+            ):
+                all_names = None  # Not a literal list of names
+                continue
+            if isinstance(node, ast.AugAssign) and all_names is not None:
+                all_names = all_names + list(value)
+            else:
+                all_names = list(value)
+
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    # ``import pkg.sub as sub`` binds the submodule itself
+                    bound, target = alias.asname, alias.name
+                elif (
+                    path.name == "__init__.py"
+                    and alias.name.startswith(module_name + ".")
+                ):
+                    # ``import pkg.sub`` in pkg sets sub as an attribute
+                    bound = alias.name[len(module_name) + 1 :].partition(".")[0]
+                    target = f"{module_name}.{bound}"
+                else:
+                    continue
+                if not target.startswith(top_level + "."):
+                    continue
+                target_dir = root.joinpath(*target.split("."))
+                depends.update((target_dir, target_dir.parent))
+                if _module_source(target, root):
+                    names[bound] = ("module", target)
+
+        elif isinstance(node, ast.ImportFrom):
+            # Resolve relative imports against the containing package
+            if node.level:
+                base = package_parts[: len(package_parts) - node.level + 1]
+                source = ".".join(base + ([node.module] if node.module else []))
+            else:
+                source = node.module
+            if source != top_level and not source.startswith(top_level + "."):
+                continue
+
+            # Adding or removing a module changes these directories
+            source_dir = root.joinpath(*source.split("."))
+            depends.update((source_dir, source_dir.parent))
+
+            source_path = _module_source(source, root)
+            if source_path is not None:
+                source_names, source_all, source_depends = _parse_module(
+                    source, source_path, root, _parsing
+                )
+                depends.update(source_depends)
+            else:
+                source_names, source_all = {}, None
+
+            # Importing from a submodule also binds it in its package
+            if (
+                path.name == "__init__.py"
+                and source_path is not None
+                and source.startswith(module_name + ".")
+            ):
+                child = source[len(module_name) + 1 :].partition(".")[0]
+                names[child] = ("module", f"{module_name}.{child}")
+
+            for alias in node.names:
+                if alias.name == "*":
+                    if source_all is None:
+                        source_all = [
+                            name
+                            for name in source_names
+                            if not name.startswith("_")
+                        ]
+                    names.update(
+                        (name, source_names[name])
+                        for name in source_all
+                        if name in source_names
+                    )
+                elif _module_source(f"{source}.{alias.name}", root):
+                    names[alias.asname or alias.name] = (
+                        "module",
+                        f"{source}.{alias.name}",
+                    )
+                elif alias.name in source_names:
+                    names[alias.asname or alias.name] = source_names[alias.name]
+
+    _parsed_modules[path] = names, all_names, depends
+    return names, all_names, depends
+
+
+def get_public_members(
+    module_name: str, path: Path, cache: Optional[Dict[str, dict]] = None
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Extract public functions, classes, and submodules from a module's source.
+
+    The source is parsed with `ast` rather than imported, so no module
+    code runs. Only names defined in the module or one of its submodules
+    are listed; ``__all__`` is respected when it is a literal.
+
+    When a cache is given, results are reused as long as every file they
+    were derived from has the same mtime and size as when they were
+    stored, and the cache is updated otherwise.
+
+    Parameters
+    ----------
+    module_name : str
+        Full module name (e.g., 'mypackage.submodule').
+    path : Path
+        Source file of the module.
+    cache : dict, optional
+        Mapping of module name to cached members, updated in place.
+
+    Returns
+    -------
+    functions : list of str
+        Public function names.
+    classes : list of str
+        Public class names.
+    submodules : list of str
+        Public submodule names.
+    """
+    cached = _cache_get(cache, module_name)
+    if cached is not None:
+        return cached
+
+    names, all_names, depends = _parse_module(
+        module_name, path, _source_root(module_name, path)
+    )
+    if all_names is None:
+        all_names = [name for name in names if not name.startswith("_")]
 
+    module_prefix = module_name + "."
+    functions = []
+    classes = []
+    submodules = set()
 
-def get_public_members(module) -> tuple[List[str], List[str], List[str]]:
+    for name in all_names:
+        kind, origin = names.get(name, (None, ""))
+        if origin != module_name and not origin.startswith(module_prefix):
+            continue
+        if kind == "function":
+            functions.append(name)
+        elif kind == "class":
+            classes.append(name)
+        elif kind == "module":
+            submodules.add(name)
+
+    members = sorted(functions), sorted(classes), sorted(submodules)
+    _cache_put(cache, module_name, depends, members)
+    return members
+
+
+def get_imported_members(
+    module, cache: Optional[Dict[str, dict]] = None
+) -> Tuple[List[str], List[str], List[str]]:
     """
-    Extract public functions, classes, and submodules from a module.
+    Extract public functions, classes, and submodules from an imported module.
+
+    Fallback for modules without Python source, such as extension
+    modules, which `get_public_members` cannot parse.
+
+    When a cache is given, results are reused as long as every file they
+    were derived from has the same mtime and size as when they were
+    stored, and the cache is updated otherwise.
 
     Parameters
     ----------
     module : module
         Python module to inspect.
+    cache : dict, optional
+        Mapping of module name to cached members, updated in place.
 
     Returns
     -------
@@ -37,6 +458,17 @@ def get_public_members(module) -> tuple[List[str], List[str], List[str]]:
     submodules : list of str
         Public submodule names.
     """
+    module_file = getattr(module, "__file__", None)
+    if module_file:
+        cached = _cache_get(cache, module.__name__)
+        if cached is not None:
+            return cached
+
+    # __module__ strings are normally interned, so comparing against an
+    # interned name usually succeeds on the identity check alone
+    module_name = sys.intern(module.__name__)
+    module_prefix = module_name + "."
+
     functions = []
     classes = []
     submodules = []
@@ -50,25 +482,69 @@ def get_public_members(module) -> tuple[List[str], List[str], List[str]]:
         except (AttributeError, ImportError):
             continue
 
-        # Check if defined in this module (not imported)
-        if hasattr(obj, "__module__") and not obj.__module__.startswith(
-            module.__name__
+        # Check if defined in this module or a submodule (not imported)
+        obj_module = getattr(obj, "__module__", None)
+        if (
+            obj_module is not None
+            and obj_module != module_name
+            and not obj_module.startswith(module_prefix)
         ):
             continue
 
-        if inspect.isfunction(obj):
+        # Exact type checks are much cheaper than the inspect.isxxx helpers
+        obj_type = type(obj)
+        if obj_type is FunctionType or obj_type is BuiltinFunctionType:
             functions.append(name)
-        elif inspect.isclass(obj):
+        elif isinstance(obj, type):
             classes.append(name)
-        elif inspect.ismodule(obj) and obj.__name__.startswith(module.__name__):
+        elif obj_type is ModuleType and obj.__name__.startswith(module_prefix):
             submodules.append(name)
 
-    return sorted(functions), sorted(classes), sorted(submodules)
+    members = sorted(functions), sorted(classes), sorted(submodules)
+    if module_file:
+        _cache_put(cache, module.__name__, [Path(module_file)], members)
+    return members
+
+
+def write_if_changed(filename: Path, content: str) -> bool:
+    """
+    Write content to a file only if it differs from what is on disk.
+
+    Leaving unchanged files untouched preserves their mtimes, so Sphinx
+    does not re-read and re-render pages whose API did not change. Files
+    are always written with ``\n`` line endings, and existing files are
+    read with universal newlines, so the comparison holds on Windows.
+
+    Parameters
+    ----------
+    filename : Path
+        File to write.
+    content : str
+        New file contents.
+
+    Returns
+    -------
+    bool
+        True if the file was written, False if it was already up to date.
+    """
+    try:
+        if filename.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    with open(filename, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    return True
 
 
 def generate_module_doc(
-    module_name: str, output_dir: Path, package_name: str
-) -> None:
+    module_name: str,
+    output_dir: Path,
+    package_name: str,
+    cache: Optional[Dict[str, dict]] = None,
+    source: Optional[Path] = None,
+) -> Dict[str, dict]:
     """
     Generate reStructuredText documentation for a single module.
 
@@ -80,70 +556,90 @@ def generate_module_doc(
         Directory to write documentation files.
     package_name : str
         Top-level package name.
+    cache : dict, optional
+        Public members cache, passed on to `get_public_members`.
+    source : Path, optional
+        Source file of the module. If not given, the module is imported
+        and inspected instead.
+
+    Returns
+    -------
+    dict
+        The cache, updated with this module's entry. Returned so that
+        worker processes can send their updates back.
     """
-    try:
-        module = importlib.import_module(module_name)
-    except ImportError as e:
-        print(f"Warning: Could not import {module_name}: {e}")
-        return
+    if cache is None:
+        cache = {}
 
-    functions, classes, submodules = get_public_members(module)
+    if source is not None:
+        try:
+            functions, classes, submodules = get_public_members(
+                module_name, source, cache
+            )
+        except SyntaxError as e:
+            print(f"Warning: Could not parse {module_name}: {e}")
+            return cache
+    else:
+        # Modules imported up front (or by a parent package) are already
+        # in sys.modules; skip the import machinery for them
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError as e:
+                print(f"Warning: Could not import {module_name}: {e}")
+                return cache
+
+        functions, classes, submodules = get_imported_members(module, cache)
 
     if not (functions or classes or submodules):
         print(f"Skipping {module_name} (no public members)")
-        return
+        return cache
 
     # Create output file
     filename = output_dir / f"{module_name}.rst"
     filename.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(filename, "w") as f:
-        # Title
-        title = module_name
-        f.write(f"{title}\n")
-        f.write("=" * len(title) + "\n\n")
-
-        # Module docstring
-        f.write(f".. automodule:: {module_name}\n\n")
-
-        # Functions section
-        if functions:
-            f.write("Functions\n")
-            f.write("-" * 9 + "\n\n")
-            f.write(".. autosummary::\n")
-            f.write("   :toctree: generated/\n\n")
-            for func in functions:
-                f.write(f"   {func}\n")
-            f.write("\n")
-
-        # Classes section
-        if classes:
-            f.write("Classes\n")
-            f.write("-" * 7 + "\n\n")
-            f.write(".. autosummary::\n")
-            f.write("   :toctree: generated/\n")
-            f.write("   :template: class.rst\n\n")
-            for cls in classes:
-                f.write(f"   {cls}\n")
-            f.write("\n")
-
-        # Submodules section
-        if submodules:
-            f.write("Submodules\n")
-            f.write("-" * 10 + "\n\n")
-            f.write(".. autosummary::\n")
-            f.write("   :toctree: generated/\n")
-            f.write("   :recursive:\n\n")
-            for submod in submodules:
-                f.write(f"   {submod}\n")
-            f.write("\n")
-
-    print(f"Generated: {filename}")
-
-
-def discover_modules(package_name: str) -> Set[str]:
+    # Collect the page in memory and write it with a single call
+    parts = []
+
+    # Title
+    title = module_name
+    parts.append(f"{title}\n")
+    parts.append("=" * len(title) + "\n\n")
+
+    # Module docstring
+    parts.append(f".. automodule:: {module_name}\n\n")
+
+    # Functions section
+    if functions:
+        parts.append(FUNCTIONS_HEADER)
+        parts.append("".join(f"   {func}\n" for func in functions))
+        parts.append("\n")
+
+    # Classes section
+    if classes:
+        parts.append(CLASSES_HEADER)
+        parts.append("".join(f"   {cls}\n" for cls in classes))
+        parts.append("\n")
+
+    # Submodules section
+    if submodules:
+        parts.append(SUBMODULES_HEADER)
+        parts.append("".join(f"   {submod}\n" for submod in submodules))
+        parts.append("\n")
+
+    if write_if_changed(filename, "".join(parts)):
+        print(f"Generated: {filename}")
+    else:
+        print(f"Unchanged: {filename}")
+
+    return cache
+
+
+def discover_modules(package_name: str) -> Dict[str, Optional[Path]]:
     """
-    Discover all modules in a package.
+    Discover all modules in a package without importing them.
 
     Parameters
     ----------
@@ -152,39 +648,68 @@ def discover_modules(package_name: str) -> Set[str]:
 
     Returns
     -------
-    set of str
-        Set of module names.
+    dict
+        Mapping of module name to its Python source file, or None for
+        modules without one (e.g., extension modules).
     """
+
+    def source_of(spec) -> Optional[Path]:
+        origin = spec.origin
+        return Path(origin) if origin and origin.endswith(".py") else None
+
     try:
-        package = importlib.import_module(package_name)
-    except ImportError as e:
-        print(f"Error: Could not import package {package_name}: {e}")
+        spec = importlib.util.find_spec(package_name)
+    except (ImportError, ValueError) as e:
+        print(f"Error: Could not find package {package_name}: {e}")
+        sys.exit(1)
+    if spec is None:
+        print(f"Error: Could not find package {package_name}")
         sys.exit(1)
 
-    modules = {package_name}
-
-    # Get package path
-    if hasattr(package, "__path__"):
-        package_path = Path(package.__path__[0])
+    modules = {package_name: source_of(spec)}
 
-        # Find all Python files
-        for py_file in package_path.rglob("*.py"):
-            if py_file.name.startswith("_") and py_file.name != "__init__.py":
+    def walk(search_locations, prefix: str) -> None:
+        for module_info in pkgutil.iter_modules(search_locations, prefix):
+            # Skip private modules and everything below private packages
+            if module_info.name.rpartition(".")[2].startswith("_"):
+                continue
+            module_spec = module_info.module_finder.find_spec(module_info.name)
+            if module_spec is None:
                 continue
+            modules[module_info.name] = source_of(module_spec)
+            if module_info.ispkg and module_spec.submodule_search_locations:
+                walk(
+                    list(module_spec.submodule_search_locations),
+                    f"{module_info.name}.",
+                )
 
-            # Convert file path to module name
-            relative_path = py_file.relative_to(package_path.parent)
-            module_parts = list(relative_path.parts[:-1])
+    if spec.submodule_search_locations:
+        walk(list(spec.submodule_search_locations), f"{package_name}.")
 
-            if py_file.name != "__init__.py":
-                module_parts.append(py_file.stem)
+    return modules
 
-            module_name = ".".join(module_parts)
 
-            if module_name:
-                modules.add(module_name)
+def import_modules(module_names: Set[str]) -> None:
+    """
+    Import modules that are not loaded yet, parents before children.
 
-    return modules
+    Each parent package is then imported exactly once, instead of once
+    per worker process that handles one of its submodules. Import errors
+    are left for `generate_module_doc` to report.
+
+    Parameters
+    ----------
+    module_names : set of str
+        Module names to import.
+    """
+    # Sorting puts every package before the modules it contains
+    for module_name in sorted(module_names):
+        if module_name in sys.modules:
+            continue
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
 
 
 def generate_api_index(
@@ -204,22 +729,36 @@ def generate_api_index(
     """
     filename = output_dir / "api.rst"
 
-    with open(filename, "w") as f:
-        title = "API Reference"
-        f.write(f"{title}\n")
-        f.write("=" * len(title) + "\n\n")
+    parts = []
+    title = "API Reference"
+    parts.append(f"{title}\n")
+    parts.append("=" * len(title) + "\n\n")
 
-        f.write(
-            f"This page contains auto-generated API documentation for {package_name}.\n\n"
-        )
+    parts.append(
+        f"This page contains auto-generated API documentation for {package_name}.\n\n"
+    )
 
-        f.write(".. toctree::\n")
-        f.write("   :maxdepth: 2\n\n")
+    parts.append(".. toctree::\n")
+    parts.append("   :maxdepth: 2\n\n")
 
-        for module in sorted(modules):
-            f.write(f"   {module}\n")
+    for module in sorted(modules):
+        parts.append(f"   {module}\n")
 
-    print(f"Generated index: {filename}")
+    if write_if_changed(filename, "".join(parts)):
+        print(f"Generated index: {filename}")
+    else:
+        print(f"Unchanged index: {filename}")
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command-line value as an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
 
 
 def main():
@@ -240,11 +779,23 @@ def main():
         default=Path("docs/reference"),
         help="Output directory for documentation (default: docs/reference)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of worker processes (default: number of CPUs)",
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
         help="Remove existing documentation files before generating",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Inspect every module, ignoring the members cache",
+    )
 
     args = parser.parse_args()
 
@@ -252,10 +803,17 @@ def main():
     if args.clean and args.output.exists():
         import shutil
 
-        for item in args.output.glob("*.rst"):
-            if item.name != "index.rst":  # Keep index
-                item.unlink()
-                print(f"Removed: {item}")
+        with os.scandir(args.output) as entries:
+            for entry in entries:
+                # Keep index
+                if entry.name.endswith(".rst") and entry.name != "index.rst":
+                    os.unlink(entry.path)
+                    print(f"Removed: {entry.path}")
+
+        cache_file = args.output / CACHE_FILENAME
+        if cache_file.exists():
+            cache_file.unlink()
+            print(f"Removed: {cache_file}")
 
         generated_dir = args.output / "generated"
         if generated_dir.exists():
@@ -269,12 +827,40 @@ def main():
     modules = discover_modules(args.package)
     print(f"Found {len(modules)} modules")
 
+    # Only modules without Python source need importing; import them once
+    # up front so forked workers inherit sys.modules
+    import_modules({module for module, source in modules.items() if source is None})
+
+    cache_file = args.output / CACHE_FILENAME
+    cache = {} if args.no_cache else load_cache(cache_file)
+
+    # Spread the modules over worker processes. Every module writes to its
+    # own file, and each worker gets only its module's cache entry and
+    # sends it back updated. Parsing is cheap, so small packages do not
+    # get more workers than they have modules.
     print("\nGenerating documentation files...")
-    for module in sorted(modules):
-        generate_module_doc(module, args.output, args.package)
+    new_cache = {}
+    jobs = max(1, min(args.jobs, len(modules)))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                generate_module_doc,
+                module,
+                args.output,
+                args.package,
+                {module: cache[module]} if module in cache else {},
+                modules[module],
+            )
+            for module in sorted(modules)
+        ]
+        for future in futures:
+            new_cache.update(future.result())
+
+    if not args.no_cache:
+        save_cache(cache_file, new_cache)
 
     print("\nGenerating API index...")
-    generate_api_index(args.package, modules, args.output)
+    generate_api_index(args.package, set(modules), args.output)
 
     print("\nDone! API documentation generated successfully.")
     print(f"Documentation files: {args.output}")